@@ -1,9 +1,60 @@
+from django.conf import settings
+from django.db import connection
 from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.contrib import messages
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+
+class QueryCountLogMiddleware:
+    """
+    Development-only guard against query-count regressions.
+
+    The list/detail views are exactly the shape that regrows N+1
+    patterns on template changes, so when DEBUG is on (connection.queries
+    is only recorded then) this logs a warning for any request that runs
+    more than QUERY_WARNING_THRESHOLD queries or repeats the same SQL
+    shape more than DUPLICATE_WARNING_THRESHOLD times — the signature of
+    a per-row SELECT loop. It does nothing in production.
+    """
+    QUERY_WARNING_THRESHOLD = 30
+    DUPLICATE_WARNING_THRESHOLD = 5
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DEBUG:
+            return self.get_response(request)
+
+        queries_before = len(connection.queries)
+        response = self.get_response(request)
+        queries = connection.queries[queries_before:]
+
+        if len(queries) > self.QUERY_WARNING_THRESHOLD:
+            logger.warning(
+                '%s %s ran %d queries (threshold %d)',
+                request.method, request.path, len(queries),
+                self.QUERY_WARNING_THRESHOLD,
+            )
+
+        seen = {}
+        for query in queries:
+            sql = query['sql']
+            seen[sql] = seen.get(sql, 0) + 1
+        for sql, count in seen.items():
+            if count > self.DUPLICATE_WARNING_THRESHOLD:
+                logger.warning(
+                    '%s %s repeated a query %d times (possible N+1): %.200s',
+                    request.method, request.path, count, sql,
+                )
+
+        return response
+
 
 class RoleRequiredMiddleware:
     def __init__(self, get_response): 
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.17 on 2026-09-01 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0006_payslip'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['department'], name='core_user_departm_04962c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='core_user_role_73872d_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-09-01 09:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_user_core_user_departm_04962c_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['status', 'from_date'], name='core_leave_status_5bec39_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-09-01 09:49
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_leave_core_leave_status_5bec39_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='work_duration',
+            field=models.GeneratedField(db_persist=True, expression=models.ExpressionWrapper(django.db.models.expressions.CombinedExpression(models.F('logout_time'), '-', models.F('login_time')), output_field=models.DurationField()), help_text='Worked duration, computed by the database at write time', output_field=models.DurationField()),
+        ),
+    ]
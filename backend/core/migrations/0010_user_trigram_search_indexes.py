@@ -0,0 +1,42 @@
+from django.db import migrations
+
+# GIN trigram indexes backing the icontains filters in the employee
+# search; created only on PostgreSQL since SQLite (development) has no
+# pg_trgm equivalent and falls back to its normal LIKE handling.
+TRIGRAM_INDEXES = {
+    'core_user_first_name_trgm': 'first_name',
+    'core_user_last_name_trgm': 'last_name',
+    'core_user_username_trgm': 'username',
+    'core_user_employee_id_trgm': 'employee_id',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for index_name, column in TRIGRAM_INDEXES.items():
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {index_name} '
+                f'ON core_user USING gin ({column} gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for index_name in TRIGRAM_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_attendance_work_duration'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
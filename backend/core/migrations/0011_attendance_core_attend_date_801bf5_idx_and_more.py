@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-09-01 09:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_user_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date'], name='core_attend_date_801bf5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['employee', 'status', 'from_date'], name='core_leave_employe_0f6a62_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leave',
+            index=models.Index(fields=['status', 'applied_on'], name='core_leave_status_36a816_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# Companion to 0010: the attendance and leave list filters also run
+# icontains against User.department, so give it the same GIN trigram
+# backing on PostgreSQL; SQLite (development) keeps its LIKE handling.
+INDEX_NAME = 'core_user_department_trgm'
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {INDEX_NAME} '
+            f'ON core_user USING gin (department gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX IF EXISTS {INDEX_NAME}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_attendance_core_attend_date_801bf5_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-09-01 10:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_user_department_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payslip',
+            index=models.Index(fields=['employee', '-year', '-month'], name='core_paysli_employe_aec490_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-created_at'], name='core_projec_created_63f7be_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'manager'], name='core_projec_status_65f068_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timesheetentry',
+            index=models.Index(fields=['employee', '-date'], name='core_timesh_employe_1f403f_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.conf import settings
+from django.utils.functional import cached_property
 
 
 class Role(models.TextChoices):
@@ -10,10 +13,21 @@ class Role(models.TextChoices):
     ADMIN = "ADMIN", "Admin"
 
 
+@lru_cache(maxsize=None)
+def role_display(role):
+    """Cached role code -> display label lookup (Role.choices is static)."""
+    return dict(Role.choices).get(role, 'No Role')
+
+
 class User(AbstractUser):
     """
     Custom User model extending AbstractUser with role assignment.
     """
+    # Bit values for the role_flags bitmask (see role_flags below)
+    ROLE_FLAG_HR = 1
+    ROLE_FLAG_MANAGER = 2
+    ROLE_FLAG_ADMIN = 4
+
     role = models.CharField(
         max_length=20, 
         choices=Role.choices, 
@@ -53,6 +67,11 @@ class User(AbstractUser):
         ordering = ['username']
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            # Employee directory filters on these columns
+            models.Index(fields=['department']),
+            models.Index(fields=['role']),
+        ]
     
     def __str__(self):
         return f"{self.username} ({self.get_full_name() or 'No Name'})"
@@ -60,23 +79,38 @@ class User(AbstractUser):
     @property
     def role_name(self):
         """Return the role name or 'No Role' if not assigned."""
-        return self.get_role_display() if self.role else 'No Role'
+        return role_display(self.role) if self.role else 'No Role'
     
     def has_role(self, role_name):
         """Check if user has a specific role."""
         return self.role == role_name
-    
+
+    @cached_property
+    def role_flags(self):
+        """
+        Bitmask of role booleans (HR=1, MANAGER=2, ADMIN=4), computed once
+        per instance so repeated role checks in a request cost one int read.
+        """
+        flags = 0
+        if self.role == Role.HR:
+            flags |= self.ROLE_FLAG_HR
+        elif self.role == Role.MANAGER:
+            flags |= self.ROLE_FLAG_MANAGER
+        elif self.role == Role.ADMIN:
+            flags |= self.ROLE_FLAG_ADMIN
+        return flags
+
     def is_hr(self):
         """Check if user is in HR role."""
-        return self.has_role(Role.HR)
-    
+        return bool(self.role_flags & self.ROLE_FLAG_HR)
+
     def is_manager(self):
         """Check if user is a Manager."""
-        return self.has_role(Role.MANAGER)
-    
+        return bool(self.role_flags & self.ROLE_FLAG_MANAGER)
+
     def is_admin_role(self):
         """Check if user is in Admin role (different from Django's is_staff)."""
-        return self.has_role(Role.ADMIN)
+        return bool(self.role_flags & self.ROLE_FLAG_ADMIN)
 
 
 class EmployeeProfile(models.Model):
@@ -248,7 +282,26 @@ class EmployeeProfile(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    # Maps Leave.leave_type codes to their balance columns; leave types
+    # without an entry (UNPAID, OTHER) are not balance-tracked. Single
+    # source of truth for every view that reads or deducts balances.
+    LEAVE_BALANCE_FIELDS = {
+        'ANNUAL': 'annual_leaves',
+        'SICK': 'sick_leaves',
+        'MATERNITY': 'maternity_leaves',
+        'PATERNITY': 'paternity_leaves',
+        'EMERGENCY': 'emergency_leaves',
+        'COMPENSATORY': 'compensatory_leaves',
+    }
+
+    def leave_balances(self):
+        """Balance per tracked leave type, keyed by leave_type code."""
+        return {
+            leave_type: getattr(self, field)
+            for leave_type, field in self.LEAVE_BALANCE_FIELDS.items()
+        }
+
     class Meta:
         ordering = ['user__last_name', 'user__first_name']
         verbose_name = 'Employee Profile'
@@ -320,22 +373,35 @@ class Attendance(models.Model):
     device_info = models.TextField(blank=True)
     location = models.CharField(max_length=255, blank=True)
     risk_score = models.FloatField(default=0.0)
-    
+    work_duration = models.GeneratedField(
+        expression=models.ExpressionWrapper(
+            models.F('logout_time') - models.F('login_time'),
+            output_field=models.DurationField(),
+        ),
+        output_field=models.DurationField(),
+        db_persist=True,
+        help_text="Worked duration, computed by the database at write time",
+    )
+
     class Meta:
         ordering = ['-date', '-login_time']
         unique_together = ['employee', 'date']
         verbose_name = 'Attendance'
         verbose_name_plural = 'Attendance Records'
-    
+        indexes = [
+            # Team/date-window reports filter on date alone; per-employee
+            # lookups are covered by the unique_together index above
+            models.Index(fields=['date']),
+        ]
+
     def __str__(self):
         return f"{self.employee.get_full_name()} - {self.date}"
-    
+
     @property
     def working_hours(self):
-        """Calculate total working hours for the day."""
-        if self.login_time and self.logout_time:
-            duration = self.logout_time - self.login_time
-            return round(duration.total_seconds() / 3600, 2)
+        """Total working hours for the day, read from the stored duration."""
+        if self.work_duration is not None:
+            return round(self.work_duration.total_seconds() / 3600, 2)
         return None
     
     @property
@@ -416,6 +482,14 @@ class Leave(models.Model):
         ordering = ['-applied_on']
         verbose_name = 'Leave'
         verbose_name_plural = 'Leaves'
+        indexes = [
+            # Pending-approval listings and date-window reports filter on these
+            models.Index(fields=['status', 'from_date']),
+            # Per-employee balance/usage queries filter on all three
+            models.Index(fields=['employee', 'status', 'from_date']),
+            # Manager/HR lists filter by status and order by applied_on
+            models.Index(fields=['status', 'applied_on']),
+        ]
     
     def __str__(self):
         return f"{self.employee.get_full_name()} - {self.leave_type} ({self.from_date} to {self.to_date})"
@@ -451,6 +525,12 @@ class Project(models.Model):
         ordering = ['name']
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
+        indexes = [
+            # Project list orders newest-first; the status/manager pair
+            # covers its dropdown filters
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', 'manager']),
+        ]
     
     def __str__(self):
         return self.name
@@ -504,6 +584,11 @@ class TimesheetEntry(models.Model):
         unique_together = ['employee', 'date', 'project']
         verbose_name = 'Timesheet Entry'
         verbose_name_plural = 'Timesheet Entries'
+        indexes = [
+            # Per-employee timesheet views filter on employee and walk
+            # dates newest-first (recent entries, weekly windows)
+            models.Index(fields=['employee', '-date']),
+        ]
     
     def __str__(self):
         project_name = self.project.name if self.project else 'No Project'
@@ -685,6 +770,11 @@ class Payslip(models.Model):
         unique_together = ['employee', 'month', 'year']
         verbose_name = 'Payslip'
         verbose_name_plural = 'Payslips'
+        indexes = [
+            # my_payslips filters on employee and orders -year, -month;
+            # this lets that resolve as a backward index scan
+            models.Index(fields=['employee', '-year', '-month']),
+        ]
     
     def __str__(self):
         from calendar import month_name
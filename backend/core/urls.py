@@ -1,19 +1,28 @@
-from django.urls import path
+from functools import lru_cache
+
+from django.urls import path, reverse
 from django.shortcuts import redirect
-from django.contrib.auth.views import LogoutView
 from . import views
 
+
+@lru_cache(maxsize=None)
+def _resolve_url(url_name):
+    """Cache URL name -> path resolution; the URLconf is static at runtime."""
+    return reverse(url_name)
+
+
 def home_redirect(request):
     """Redirect root URL to login or dashboard based on auth status"""
     if request.user.is_authenticated:
-        return redirect('dashboard')
-    return redirect('login')
+        return redirect(_resolve_url('dashboard'))
+    return redirect(_resolve_url('login'))
 
 urlpatterns = [
     path('login/', views.login_view, name='login'),
     path('logout/', views.logout_view, name='logout'),
     path('dashboard/', views.dashboard_view, name='dashboard'),
     path('dashboard/employee/', views.dashboard_employee_view, name='dashboard_employee'),
+    path('dashboard/widgets/', views.dashboard_widgets_api, name='dashboard_widgets_api'),
     path('dashboard/hr/', views.dashboard_hr_view, name='dashboard_hr'),
     path('profile/', views.profile_view, name='profile'),
     path('directory/', views.org_directory, name='org_directory'),
@@ -61,7 +70,7 @@ urlpatterns = [
     # Timesheet Management
     path('timesheets/', views.timesheet_entry, name='timesheet_entry'),
     path('timesheets/weekly/', views.timesheet_weekly_summary, name='timesheet_weekly_summary'),
-    path('timesheets/daily/<str:date>/', views.timesheet_daily_entries, name='timesheet_daily_entries'),
+    path('timesheets/daily/<str:entry_date>/', views.timesheet_daily_entries, name='timesheet_daily_entries'),
     path('timesheets/edit/<int:entry_id>/', views.timesheet_edit_entry, name='timesheet_edit_entry'),
     path('timesheets/delete/<int:entry_id>/', views.timesheet_delete_entry, name='timesheet_delete_entry'),
     
@@ -1,24 +1,120 @@
+import csv
+import hashlib
+import io
+import json
+from collections import defaultdict
+from functools import lru_cache
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.urls import reverse
 from django.views.decorators.csrf import csrf_protect, csrf_exempt
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_POST
-from django.db.models import Q, Sum
-from django.db import models
+from django.db.models import Q, Sum, Count, F, ExpressionWrapper, DurationField, Prefetch
+from django.db.models.functions import Substr
+from django.db import connection, transaction
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponseNotModified
 from django.utils import timezone
-from datetime import date
-import json
-from .decorators import role_required, hr_required, admin_required, manager_or_hr_required, can_manage_leave
-from .models import User, EmployeeProfile, Attendance, Leave, Project, ProjectMember, TimesheetEntry, Payslip
-from .middleware import hr_or_admin_required, manager_or_above_required
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from datetime import date, datetime, time, timedelta
+from .decorators import hr_required, admin_required, manager_required, manager_or_hr_required, can_manage_leave
+from .models import Role, role_display, User, EmployeeProfile, Attendance, Leave, Project, ProjectMember, TimesheetEntry, Payslip
 from .forms import LeaveApplicationForm, ProjectForm, ProjectMemberForm, ProjectMemberEditForm, TimesheetEntryForm, TimesheetEntryEditForm, PayslipForm, PayslipBulkUploadForm
 
 
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that memoizes its COUNT(*) in the cache.
+
+    Used by list views over tables that grow without bound (payslips,
+    projects), where the per-request COUNT becomes the dominant cost.
+    The count is recomputed at most once per timeout for a given filter
+    signature; small result sets are never cached so fresh tables stay
+    exact.
+
+    When an unfiltered view passes estimate_model, PostgreSQL answers
+    the count from the planner's pg_class.reltuples statistic instead of
+    scanning the table; small and filtered sets, and other backends
+    (SQLite in development), keep the exact COUNT. Check is_estimate to
+    mark the total as approximate in templates.
+    """
+    COUNT_TTL = 600
+    COUNT_CACHE_THRESHOLD = 1000
+
+    def __init__(self, object_list, per_page, count_key=None,
+                 estimate_model=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count_key = count_key
+        self._estimate_model = estimate_model
+        self.is_estimate = False
+
+    def _estimated_count(self):
+        """Row estimate from planner statistics, or None to count exactly."""
+        if self._estimate_model is None or connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [self._estimate_model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 before the first ANALYZE and unreliable for
+        # small tables; those fall through to the exact COUNT
+        if row is None or row[0] < self.COUNT_CACHE_THRESHOLD:
+            return None
+        return int(row[0])
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None:
+            self.is_estimate = True
+            return estimate
+        if self._count_key is None:
+            return self.object_list.count()
+        key = 'paginator_count:%s' % hashlib.md5(
+            self._count_key.encode()
+        ).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = self.object_list.count()
+            if count > self.COUNT_CACHE_THRESHOLD:
+                cache.set(key, count, self.COUNT_TTL)
+        return count
+
+
+def _directory_search(employees, search_query):
+    """
+    Apply the employee directory free-text search to a queryset.
+
+    On PostgreSQL this uses a full-text SearchVector over the searchable
+    columns, which beats a chain of OR'd ILIKE scans; on other backends
+    (SQLite in development) it falls back to the icontains filters.
+    """
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+        return employees.annotate(
+            search=SearchVector(
+                'first_name', 'last_name', 'username', 'email',
+                'employee_id', 'department', 'employeeprofile__designation',
+            )
+        ).filter(search=SearchQuery(search_query))
+    return employees.filter(
+        Q(first_name__icontains=search_query) |
+        Q(last_name__icontains=search_query) |
+        Q(username__icontains=search_query) |
+        Q(email__icontains=search_query) |
+        Q(employee_id__icontains=search_query) |
+        Q(department__icontains=search_query) |
+        Q(employeeprofile__designation__icontains=search_query)
+    )
+
+
 @csrf_protect
 @never_cache
 def login_view(request):
@@ -74,21 +170,19 @@ def dashboard_view(request):
         return redirect('dashboard_employee')
 
 
-@login_required
-def dashboard_employee_view(request):
-    """Employee dashboard with attendance, leaves, and projects widgets."""
-    user = request.user
-    from datetime import date, timedelta, datetime
-    from django.utils import timezone
-    from django.db.models import Sum, Count
-    
+def _employee_dashboard_widgets(user):
+    """Build the attendance/leave/project widget data for a user's dashboard."""
+
     today = date.today()
     this_week_start = today - timedelta(days=today.weekday())
     this_week_end = this_week_start + timedelta(days=6)
     this_month_start = today.replace(day=1)
     
-    # Get today's attendance status
-    today_attendance = Attendance.objects.filter(employee=user, date=today).first()
+    # Get today's attendance status; the widget only needs the clock
+    # times and stored duration, not the whole row
+    today_attendance = Attendance.objects.filter(
+        employee=user, date=today
+    ).only('login_time', 'logout_time', 'work_duration').first()
     today_status = 'Not Checked In'
     if today_attendance:
         if today_attendance.is_clocked_in:
@@ -110,12 +204,20 @@ def dashboard_employee_view(request):
     
     # Get leave data
     pending_leaves = Leave.objects.filter(employee=user, status='PENDING').count()
-    approved_leaves_this_year = Leave.objects.filter(
+    # duration_days is (to_date - from_date).days + 1, so the total is the
+    # summed date spans plus one day per approved leave
+    leave_usage = Leave.objects.filter(
         employee=user,
         status='APPROVED',
         from_date__year=today.year
+    ).aggregate(
+        span=Sum(ExpressionWrapper(
+            F('to_date') - F('from_date'),
+            output_field=DurationField()
+        )),
+        leaves=Count('id'),
     )
-    used_leave_days = sum(leave.duration_days for leave in approved_leaves_this_year)
+    used_leave_days = (leave_usage['span'].days if leave_usage['span'] else 0) + leave_usage['leaves']
     available_leave_days = 25 - used_leave_days  # Assuming 25 annual leave days
     
     # Get upcoming approved leaves
@@ -129,18 +231,14 @@ def dashboard_employee_view(request):
         for leave in upcoming_leaves
     ]) or 'No upcoming leaves'
     
-    # Get project data
-    active_projects = ProjectMember.objects.filter(
-        employee=user,
-        project__status='ACTIVE'
-    ).count()
-    
-    # Get recent project
-    recent_project_member = ProjectMember.objects.filter(
+    # Get project data: one joined query covers both the active project
+    # count and the most recently joined project's name
+    active_project_names = list(ProjectMember.objects.filter(
         employee=user,
         project__status='ACTIVE'
-    ).select_related('project').order_by('-joined_on').first()
-    recent_project_name = recent_project_member.project.name if recent_project_member else 'No active projects'
+    ).order_by('-joined_on').values_list('project__name', flat=True))
+    active_projects = len(active_project_names)
+    recent_project_name = active_project_names[0] if active_project_names else 'No active projects'
     
     # Get today's timesheet entries count as "tasks"
     today_timesheet_entries = TimesheetEntry.objects.filter(
@@ -148,10 +246,7 @@ def dashboard_employee_view(request):
         date=today
     ).count()
     
-    context = {
-        'user': user,
-        'role': user.role,
-        'role_display': user.get_role_display() if user.role else 'Employee',
+    return {
         # Attendance widget data
         'attendance_data': {
             'today_status': today_status,
@@ -171,73 +266,102 @@ def dashboard_employee_view(request):
             'recent_project': recent_project_name,
         },
     }
-    
-    return render(request, 'core/dashboard_employee.html', context)
 
 
 @login_required
-@hr_required
-def dashboard_hr_view(request):
-    """HR dashboard with organization-wide widgets and management tools."""
+def dashboard_employee_view(request):
+    """Employee dashboard with attendance, leaves, and projects widgets."""
     user = request.user
-    from datetime import date, timedelta, datetime
-    from django.utils import timezone
-    from django.db.models import Sum, Count
-    
+
+    context = {
+        'user': user,
+        'role': user.role,
+        'role_display': user.get_role_display() if user.role else 'Employee',
+    }
+    context.update(_employee_dashboard_widgets(user))
+
+    return render(request, 'core/dashboard_employee.html', context)
+
+
+@login_required
+def dashboard_widgets_api(request):
+    """
+    API endpoint serving the employee dashboard widget data as JSON.
+    Cached per user for a short TTL so widget refreshes skip the
+    underlying queries.
+    """
+    cache_key = f'dashboard_widgets:{request.user.pk}'
+    widgets = cache.get(cache_key)
+    if widgets is None:
+        widgets = _employee_dashboard_widgets(request.user)
+        cache.set(cache_key, widgets, 60)
+
+    return JsonResponse({
+        'status': 'success',
+        'data': widgets,
+    })
+
+
+HR_DASHBOARD_STATS_TTL = 60  # seconds
+
+
+def _hr_dashboard_stats():
+    """
+    Build the organization-wide HR dashboard counters.
+
+    The numbers are shared by every HR/Admin viewer, so they are cached
+    under a single key for a short TTL; slightly stale widget counts are
+    acceptable in exchange for skipping the aggregate queries on most
+    dashboard loads.
+    """
+    stats = cache.get('hr_dashboard_stats')
+    if stats is not None:
+        return stats
+
     today = date.today()
     this_month_start = today.replace(day=1)
-    
-    # Organization overview data
-    total_employees = User.objects.filter(is_active=True).count()
-    new_hires_this_month = User.objects.filter(
-        hire_date__gte=this_month_start,
-        is_active=True
-    ).count()
-    active_employees = User.objects.filter(
-        is_active=True
-    ).count()
-    
+
+    # Organization overview data - one conditional aggregate per model
+    # instead of one COUNT query per widget number
+    user_stats = User.objects.filter(is_active=True).aggregate(
+        total=Count('id'),
+        new_hires=Count('id', filter=Q(hire_date__gte=this_month_start)),
+    )
+    total_employees = user_stats['total']
+    new_hires_this_month = user_stats['new_hires']
+    active_employees = user_stats['total']
+
     # Leave management data
-    pending_leaves = Leave.objects.filter(status='PENDING').count()
-    approved_today = Leave.objects.filter(
-        approved_on__date=today,
-        status='APPROVED'
-    ).count()
-    rejected_today = Leave.objects.filter(
-        updated_at__date=today,
-        status='REJECTED'
-    ).count()
-    
-    # Attendance overview data
-    today_attendance = Attendance.objects.filter(date=today)
-    present_today = today_attendance.count()
-    total_active_employees = User.objects.filter(is_active=True).count()
-    absent_today = max(0, total_active_employees - present_today)
-    
-    # Late arrivals (assuming work starts at 9:00 AM)
-    from datetime import time
+    leave_stats = Leave.objects.aggregate(
+        pending=Count('id', filter=Q(status='PENDING')),
+        approved_today=Count('id', filter=Q(status='APPROVED', approved_on__date=today)),
+        rejected_today=Count('id', filter=Q(status='REJECTED', updated_at__date=today)),
+    )
+    pending_leaves = leave_stats['pending']
+    approved_today = leave_stats['approved_today']
+    rejected_today = leave_stats['rejected_today']
+
+    # Attendance overview data (late = login after 9:00 AM work start)
     work_start_time = time(9, 0)
-    late_arrivals = today_attendance.filter(
-        login_time__time__gt=work_start_time
-    ).count()
-    
-    # Project overview data
-    active_projects = Project.objects.filter(status='ACTIVE').count()
-    completed_this_month = Project.objects.filter(
-        status='COMPLETED',
-        updated_at__gte=this_month_start
-    ).count()
-    
-    # Overdue projects (projects with end_date in the past but still active)
-    overdue_projects = Project.objects.filter(
-        status='ACTIVE',
-        end_date__lt=today
-    ).count()
+    attendance_stats = Attendance.objects.filter(date=today).aggregate(
+        present=Count('id'),
+        late=Count('id', filter=Q(login_time__time__gt=work_start_time)),
+    )
+    present_today = attendance_stats['present']
+    late_arrivals = attendance_stats['late']
+    absent_today = max(0, user_stats['total'] - present_today)
+
+    # Project overview data (overdue = end_date in the past but still active)
+    project_stats = Project.objects.aggregate(
+        active=Count('id', filter=Q(status='ACTIVE')),
+        completed_this_month=Count('id', filter=Q(status='COMPLETED', updated_at__gte=this_month_start)),
+        overdue=Count('id', filter=Q(status='ACTIVE', end_date__lt=today)),
+    )
+    active_projects = project_stats['active']
+    completed_this_month = project_stats['completed_this_month']
+    overdue_projects = project_stats['overdue']
     
-    context = {
-        'user': user,
-        'role': user.role,
-        'role_display': user.get_role_display() if user.role else 'HR',
+    stats = {
         # Organization overview widget data
         'org_data': {
             'total_employees': total_employees,
@@ -263,7 +387,23 @@ def dashboard_hr_view(request):
             'overdue_projects': overdue_projects,
         },
     }
-    
+    cache.set('hr_dashboard_stats', stats, HR_DASHBOARD_STATS_TTL)
+    return stats
+
+
+@login_required
+@hr_required
+def dashboard_hr_view(request):
+    """HR dashboard with organization-wide widgets and management tools."""
+    user = request.user
+
+    context = {
+        'user': user,
+        'role': user.role,
+        'role_display': user.get_role_display() if user.role else 'HR',
+    }
+    context.update(_hr_dashboard_stats())
+
     return render(request, 'core/dashboard_hr.html', context)
 
 
@@ -354,29 +494,31 @@ def employee_profile_edit_view(request):
 
 
 @login_required
-@manager_or_above_required
+@manager_required
 def employee_directory_view(request):
     """Employee directory with search functionality."""
     search_query = request.GET.get('q', '').strip()  # Use 'q' parameter as specified
     department_filter = request.GET.get('department', '').strip()
     role_filter = request.GET.get('role', '').strip()
     
-    # Base queryset - get all users with profiles
-    employees = User.objects.select_related('role', 'employee_profile').filter(
+    # Base queryset - get all users with profiles, restricted to the
+    # columns the directory cards actually render
+    employees = User.objects.select_related(
+        'employeeprofile', 'employeeprofile__manager'
+    ).only(
+        'first_name', 'last_name', 'username', 'email', 'employee_id',
+        'department', 'hire_date', 'phone_number', 'role',
+        'employeeprofile__designation', 'employeeprofile__doj',
+        'employeeprofile__manager__first_name',
+        'employeeprofile__manager__last_name',
+        'employeeprofile__manager__username',
+    ).filter(
         is_active=True
     ).order_by('last_name', 'first_name')
     
     # Apply search filter
     if search_query:
-        employees = employees.filter(
-            Q(first_name__icontains=search_query) |
-            Q(last_name__icontains=search_query) |
-            Q(username__icontains=search_query) |
-            Q(email__icontains=search_query) |
-            Q(employee_id__icontains=search_query) |
-            Q(department__icontains=search_query) |
-            Q(employee_profile__designation__icontains=search_query)
-        )
+        employees = _directory_search(employees, search_query)
     
     # Apply department filter
     if department_filter:
@@ -384,20 +526,11 @@ def employee_directory_view(request):
     
     # Apply role filter
     if role_filter:
-        employees = employees.filter(role__name=role_filter)
+        employees = employees.filter(role=role_filter)
     
     # Get unique departments and roles for filters
-    departments = User.objects.filter(is_active=True).exclude(
-        department__isnull=True
-    ).exclude(department__exact='').values_list(
-        'department', flat=True
-    ).distinct().order_by('department')
-    
-    roles = User.objects.filter(
-        is_active=True, role__isnull=False
-    ).select_related('role').values_list(
-        'role__name', 'role__description'
-    ).distinct().order_by('role__name')
+    departments = _department_list()
+    roles = Role.choices
     
     # Pagination
     paginator = Paginator(employees, 20)  # Show 20 employees per page
@@ -411,14 +544,14 @@ def employee_directory_view(request):
         'role_filter': role_filter,
         'departments': departments,
         'roles': roles,
-        'total_employees': employees.count(),
+        'total_employees': paginator.count,
     }
     
     return render(request, 'core/employee_directory.html', context)
 
 
 @login_required
-@hr_or_admin_required
+@hr_required
 def employee_detail_view(request, user_id):
     """Detailed employee view for HR/Admin."""
     employee = get_object_or_404(User, id=user_id, is_active=True)
@@ -445,7 +578,7 @@ def employee_detail_view(request, user_id):
 
 
 @login_required
-@manager_or_above_required
+@manager_required
 def employee_search_api(request):
     """API endpoint for employee search (AJAX)."""
     query = request.GET.get('q', '').strip()
@@ -453,29 +586,75 @@ def employee_search_api(request):
     if len(query) < 2:
         return JsonResponse({'results': []})
     
+    # values() skips model hydration - the payload is built straight from
+    # the row dicts
     employees = User.objects.filter(
         Q(first_name__icontains=query) |
         Q(last_name__icontains=query) |
         Q(username__icontains=query) |
         Q(employee_id__icontains=query),
         is_active=True
-    ).select_related('role')[:10]
-    
+    ).values(
+        'id', 'first_name', 'last_name', 'username',
+        'employee_id', 'department', 'role', 'email'
+    )[:10]
+
     results = []
     for emp in employees:
+        full_name = f"{emp['first_name']} {emp['last_name']}".strip()
         results.append({
-            'id': emp.id,
-            'name': emp.get_full_name() or emp.username,
-            'username': emp.username,
-            'employee_id': emp.employee_id or '',
-            'department': emp.department or '',
-            'role': emp.get_role_display() if emp.role else 'No Role',
-            'email': emp.email,
+            'id': emp['id'],
+            'name': full_name or emp['username'],
+            'username': emp['username'],
+            'employee_id': emp['employee_id'] or '',
+            'department': emp['department'] or '',
+            'role': role_display(emp['role']) if emp['role'] else 'No Role',
+            'email': emp['email'],
         })
-    
+
     return JsonResponse({'results': results})
 
 
+DEPARTMENT_LIST_TTL = 300  # seconds
+
+
+def _department_list():
+    """
+    Distinct department names for the filter dropdowns, cached briefly -
+    departments change on hire/transfer, not per request.
+    """
+    departments = cache.get('department_list')
+    if departments is None:
+        departments = list(
+            User.objects.filter(is_active=True).exclude(
+                Q(department__isnull=True) | Q(department='')
+            ).values_list(
+                'department', flat=True
+            ).distinct().order_by('department')
+        )
+        cache.set('department_list', departments, DEPARTMENT_LIST_TTL)
+    return departments
+
+
+# Lookups the organization directory searches across; the combined Q is
+# built once per distinct term and memoized for repeated searches
+ORG_DIRECTORY_SEARCH_LOOKUPS = (
+    'first_name__icontains',
+    'last_name__icontains',
+    'employeeprofile__department__icontains',
+    'employeeprofile__designation__icontains',
+)
+
+
+@lru_cache(maxsize=128)
+def _org_directory_q(q):
+    """Combined OR filter for the organization directory search."""
+    combined = Q()
+    for lookup in ORG_DIRECTORY_SEARCH_LOOKUPS:
+        combined |= Q(**{lookup: q})
+    return combined
+
+
 # Test views for role-based access control
 @hr_required
 def hr_only_view(request):
@@ -501,19 +680,23 @@ def admin_only_view(request):
 def org_directory(request):
     """Organization directory with search by name/department/designation."""
     q = request.GET.get('q', '').strip()
-    
-    employees = User.objects.select_related('employeeprofile').filter(is_active=True)
-    
+
+    # Single query: the template renders profile fields and each row's
+    # manager, so join both here instead of one query per row.
+    employees = User.objects.select_related(
+        'employeeprofile', 'employeeprofile__manager'
+    ).filter(is_active=True)
+
     if q:
-        employees = employees.filter(
-            Q(first_name__icontains=q) |
-            Q(last_name__icontains=q) |
-            Q(employeeprofile__department__icontains=q) |
-            Q(employeeprofile__designation__icontains=q)
-        )
-    
-    employees = employees.order_by('last_name', 'first_name')
-    
+        employees = employees.filter(_org_directory_q(q))
+
+    # The directory iterates the whole (filtered) org exactly once, so
+    # stream it in chunks instead of materializing the result cache twice
+    # - a server-side cursor on Postgres
+    employees = list(
+        employees.order_by('last_name', 'first_name').iterator(chunk_size=500)
+    )
+
     return render(request, 'core/directory.html', {
         'employees': employees,
         'search_query': q,
@@ -524,6 +707,16 @@ def org_directory(request):
 # ATTENDANCE API ENDPOINTS
 # ============================================================================
 
+# Polling clients hit the status endpoint every few seconds; serving the
+# payload from a short-lived per-user cache keeps that traffic off the
+# database. Clock-in/out delete the key so state changes show immediately.
+ATTENDANCE_STATUS_TTL = 15
+
+
+def _attendance_status_key(user_id, today):
+    return f'attendance_status:{user_id}:{today.isoformat()}'
+
+
 @csrf_exempt
 @require_POST
 @login_required
@@ -537,42 +730,54 @@ def clock_in_api(request):
         ip_address = request.META.get('REMOTE_ADDR')
         user_agent = request.META.get('HTTP_USER_AGENT', '')
         
-        # Get or create today's attendance record
-        today = date.today()
-        attendance, created = Attendance.objects.get_or_create(
+        # One clock reading per request (TIME_ZONE is UTC, so now.date()
+        # matches date.today())
+        now = timezone.now()
+        today = now.date()
+
+        # Upsert, UPDATE-first: a single UPDATE ... WHERE login_time IS
+        # NULL claims an existing row atomically; when it matches nothing
+        # we either insert today's row or report the prior clock-in.
+        # get_or_create leans on the (employee, date) unique constraint,
+        # so a concurrent insert resolves to a fetch instead of an error.
+        updated = Attendance.objects.filter(
             employee=request.user,
             date=today,
-            defaults={
-                'login_time': timezone.now(),
-                'ip': ip_address,
-                'device_info': user_agent,
-            }
-        )
-        
-        # If attendance already exists, update clock-in time if not already clocked in
-        if not created:
-            if attendance.login_time is None:
-                attendance.login_time = timezone.now()
-                attendance.ip = ip_address
-                attendance.device_info = user_agent
-                attendance.save()
+            login_time__isnull=True
+        ).update(login_time=now, ip=ip_address, device_info=user_agent)
+
+        if updated:
+            login_time, ip = now, ip_address
+            message = "Clock-in successful"
+            status = "success"
+        else:
+            attendance, created = Attendance.objects.get_or_create(
+                employee=request.user,
+                date=today,
+                defaults={
+                    'login_time': now,
+                    'ip': ip_address,
+                    'device_info': user_agent,
+                }
+            )
+            login_time, ip = attendance.login_time, attendance.ip
+            if created:
                 message = "Clock-in successful"
                 status = "success"
             else:
-                message = f"Already clocked in today at {attendance.login_time.strftime('%H:%M:%S')}"
+                message = f"Already clocked in today at {login_time.strftime('%H:%M:%S')}"
                 status = "warning"
-        else:
-            message = "Clock-in successful"
-            status = "success"
-        
+
+        cache.delete(_attendance_status_key(request.user.pk, today))
+
         return JsonResponse({
             'status': status,
             'message': message,
             'data': {
                 'employee': request.user.get_full_name() or request.user.username,
                 'date': today.isoformat(),
-                'clock_in_time': attendance.login_time.isoformat() if attendance.login_time else None,
-                'ip_address': attendance.ip,
+                'clock_in_time': login_time.isoformat() if login_time else None,
+                'ip_address': ip,
             }
         })
         
@@ -596,9 +801,14 @@ def clock_out_api(request):
         # Get request metadata
         ip_address = request.META.get('REMOTE_ADDR')
         user_agent = request.META.get('HTTP_USER_AGENT', '')
-        
-        # Get today's attendance record
-        today = date.today()
+
+        # One clock reading per request (TIME_ZONE is UTC, so now.date()
+        # matches date.today()); format the strings both response
+        # branches repeat exactly once
+        now = timezone.now()
+        today = now.date()
+        today_iso = today.isoformat()
+        employee_name = request.user.get_full_name() or request.user.username
         try:
             attendance = Attendance.objects.get(
                 employee=request.user,
@@ -617,8 +827,8 @@ def clock_out_api(request):
                 'status': 'warning',
                 'message': f'Already clocked out today at {attendance.logout_time.strftime("%H:%M:%S")}',
                 'data': {
-                    'employee': request.user.get_full_name() or request.user.username,
-                    'date': today.isoformat(),
+                    'employee': employee_name,
+                    'date': today_iso,
                     'clock_in_time': attendance.login_time.isoformat() if attendance.login_time else None,
                     'clock_out_time': attendance.logout_time.isoformat(),
                     'ip_address': attendance.ip,
@@ -633,13 +843,23 @@ def clock_out_api(request):
                 'data': None
             }, status=400)
         
-        # Update clock-out time
-        attendance.logout_time = timezone.now()
-        # Update IP and device info for clock-out (in case of different device/location)
-        if ip_address and ip_address != attendance.ip:
-            attendance.device_info += f" | Clock-out: {user_agent}"
-        attendance.save()
-        
+        # Update clock-out time and, when clocking out from a different
+        # device/location, the device info - one UPDATE touching only the
+        # changed columns instead of rewriting the whole row. The append
+        # is bounded: skip it when the agent is already recorded, and cap
+        # both sides so retried clock-outs can't grow the row forever
+        attendance.logout_time = now
+        update_values = {'logout_time': attendance.logout_time}
+        if (ip_address and ip_address != attendance.ip
+                and user_agent not in (attendance.device_info or '')):
+            attendance.device_info = (
+                (attendance.device_info or '')[:500]
+                + f" | Clock-out: {user_agent}"[:300]
+            )
+            update_values['device_info'] = attendance.device_info
+        Attendance.objects.filter(pk=attendance.pk).update(**update_values)
+        cache.delete(_attendance_status_key(request.user.pk, today))
+
         # Calculate working hours
         working_duration = attendance.logout_time - attendance.login_time
         working_hours = working_duration.total_seconds() / 3600
@@ -648,8 +868,8 @@ def clock_out_api(request):
             'status': 'success',
             'message': 'Clock-out successful',
             'data': {
-                'employee': request.user.get_full_name() or request.user.username,
-                'date': today.isoformat(),
+                'employee': employee_name,
+                'date': today_iso,
                 'clock_in_time': attendance.login_time.isoformat(),
                 'clock_out_time': attendance.logout_time.isoformat(),
                 'working_hours': round(working_hours, 2),
@@ -671,16 +891,31 @@ def attendance_status_api(request):
     API endpoint to get current attendance status for the user.
     """
     try:
-        today = date.today()
+        # One clock reading per request (TIME_ZONE is UTC, so now.date()
+        # matches date.today())
+        now = timezone.now()
+        today = now.date()
+        cache_key = _attendance_status_key(request.user.pk, today)
+        status_data = cache.get(cache_key)
+        if status_data is not None:
+            return _attendance_status_response(request, status_data)
+
+        # Both branches below repeat these; format them once
+        today_iso = today.isoformat()
+        employee_name = request.user.get_full_name() or request.user.username
         try:
-            attendance = Attendance.objects.get(
+            # Only the three columns the payload needs; skips device_info
+            # and the other unused columns
+            attendance = Attendance.objects.only(
+                'login_time', 'logout_time', 'ip'
+            ).get(
                 employee=request.user,
                 date=today
             )
-            
+
             status_data = {
-                'employee': request.user.get_full_name() or request.user.username,
-                'date': today.isoformat(),
+                'employee': employee_name,
+                'date': today_iso,
                 'clock_in_time': attendance.login_time.isoformat() if attendance.login_time else None,
                 'clock_out_time': attendance.logout_time.isoformat() if attendance.logout_time else None,
                 'ip_address': attendance.ip,
@@ -692,13 +927,13 @@ def attendance_status_api(request):
                 working_duration = attendance.logout_time - attendance.login_time
                 status_data['working_hours'] = round(working_duration.total_seconds() / 3600, 2)
             elif attendance.login_time:
-                current_duration = timezone.now() - attendance.login_time
+                current_duration = now - attendance.login_time
                 status_data['current_working_hours'] = round(current_duration.total_seconds() / 3600, 2)
             
         except Attendance.DoesNotExist:
             status_data = {
-                'employee': request.user.get_full_name() or request.user.username,
-                'date': today.isoformat(),
+                'employee': employee_name,
+                'date': today_iso,
                 'clock_in_time': None,
                 'clock_out_time': None,
                 'ip_address': None,
@@ -706,12 +941,9 @@ def attendance_status_api(request):
                 'is_clocked_out': False,
             }
         
-        return JsonResponse({
-            'status': 'success',
-            'message': 'Attendance status retrieved successfully',
-            'data': status_data
-        })
-        
+        cache.set(cache_key, status_data, ATTENDANCE_STATUS_TTL)
+        return _attendance_status_response(request, status_data)
+
     except Exception as e:
         return JsonResponse({
             'status': 'error',
@@ -720,6 +952,28 @@ def attendance_status_api(request):
         }, status=500)
 
 
+def _attendance_status_response(request, status_data):
+    """
+    Build the status JSON response with its ETag. Polling clients can
+    skip the payload when nothing changed: the ETag is a hash of the
+    status data, so stable states (not clocked in, or completed for the
+    day) answer with a 304.
+    """
+    etag = '"%s"' % hashlib.md5(
+        json.dumps(status_data, sort_keys=True).encode()
+    ).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return HttpResponseNotModified()
+
+    response = JsonResponse({
+        'status': 'success',
+        'message': 'Attendance status retrieved successfully',
+        'data': status_data
+    })
+    response['ETag'] = etag
+    return response
+
+
 @login_required
 def attendance_page(request):
     """
@@ -733,7 +987,6 @@ def employee_attendance_dashboard(request):
     """
     Employee attendance dashboard showing today's times and weekly summary.
     """
-    from datetime import datetime, timedelta
     
     user = request.user
     today = date.today()
@@ -751,12 +1004,12 @@ def employee_attendance_dashboard(request):
         date__range=[seven_days_ago, today]
     ).order_by('-date')
     
-    # Calculate total hours for the week
-    total_weekly_hours = sum(
-        record.working_hours or 0 
-        for record in weekly_attendance
-    )
-    
+    # Calculate total hours for the week from the stored durations
+    weekly_duration = weekly_attendance.aggregate(
+        total=Sum('work_duration')
+    )['total']
+    total_weekly_hours = weekly_duration.total_seconds() / 3600 if weekly_duration else 0
+
     context = {
         'today_attendance': today_attendance,
         'weekly_attendance': weekly_attendance,
@@ -768,13 +1021,11 @@ def employee_attendance_dashboard(request):
 
 
 @login_required
-@manager_or_above_required
+@manager_required
 def team_attendance_view(request):
     """
     Manager/HR team attendance view with filters for date range and department.
     """
-    from datetime import datetime, timedelta
-    from django.db.models import Q
     
     # Get filter parameters from query params
     date_from = request.GET.get('date_from')
@@ -813,17 +1064,19 @@ def team_attendance_view(request):
             Q(employee__username__icontains=employee_name)
         )
     
-    # Get attendance records
+    # Get attendance records with the employee joined so row rendering
+    # never falls back to per-record queries; only() trims the row to the
+    # columns the table actually shows (device_info etc. stay in the DB)
     attendance_records = Attendance.objects.filter(
         attendance_query
-    ).select_related('employee').order_by('-date', 'employee__first_name')
+    ).select_related('employee').only(
+        'date', 'login_time', 'logout_time', 'ip', 'work_duration',
+        'employee__first_name', 'employee__last_name',
+        'employee__username', 'employee__department',
+    ).order_by('-date', 'employee__first_name')
     
     # Get unique departments for filter dropdown
-    departments = User.objects.exclude(
-        department__isnull=True
-    ).exclude(
-        department=''
-    ).values_list('department', flat=True).distinct().order_by('department')
+    departments = _department_list()
     
     # Pagination
     paginator = Paginator(attendance_records, 20)  # 20 records per page
@@ -837,7 +1090,7 @@ def team_attendance_view(request):
         'date_to': date_to,
         'department': department,
         'employee_name': employee_name,
-        'total_records': attendance_records.count(),
+        'total_records': paginator.count,
     }
     
     return render(request, 'core/team_attendance_view.html', context)
@@ -848,10 +1101,11 @@ def apply_leave(request):
     """
     View for employees to apply for leave.
     """
-    user_profile = None
-    if hasattr(request.user, 'employeeprofile'):
-        user_profile = request.user.employeeprofile
-    
+    # One explicit query instead of the hasattr probe, which exercises
+    # the reverse-OneToOne DoesNotExist machinery for users without a
+    # profile on every request
+    user_profile = EmployeeProfile.objects.filter(user=request.user).first()
+
     if request.method == 'POST':
         form = LeaveApplicationForm(request.POST, user=request.user)
         if form.is_valid():
@@ -870,16 +1124,13 @@ def apply_leave(request):
     else:
         form = LeaveApplicationForm(user=request.user)
     
-    # Get leave balances
+    # Get leave balances, keyed by display name for the template
     leave_balances = {}
     if user_profile:
+        type_labels = dict(Leave.LEAVE_TYPE_CHOICES)
         leave_balances = {
-            'Annual Leave': user_profile.annual_leaves,
-            'Sick Leave': user_profile.sick_leaves,
-            'Maternity Leave': user_profile.maternity_leaves,
-            'Paternity Leave': user_profile.paternity_leaves,
-            'Emergency Leave': user_profile.emergency_leaves,
-            'Compensatory Leave': user_profile.compensatory_leaves,
+            type_labels[leave_type]: balance
+            for leave_type, balance in user_profile.leave_balances().items()
         }
     
     context = {
@@ -896,46 +1147,49 @@ def my_leaves(request):
     """
     View for employees to see their leave history and status.
     """
-    # Get all leaves for the current user
+    # Get all leaves for the current user; the history table shows who
+    # approved each leave, so join the approver up front
     leaves = Leave.objects.filter(
         employee=request.user
-    ).order_by('-applied_on')
+    ).select_related('approver').order_by('-applied_on')
     
     # Pagination
     paginator = Paginator(leaves, 10)  # 10 leaves per page
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    # Get leave balances
-    user_profile = None
+    # Get leave balances; fetch the profile with one explicit query
+    # rather than the hasattr probe and its DoesNotExist round-trip
+    user_profile = EmployeeProfile.objects.filter(user=request.user).first()
     leave_balances = {}
     current_year_usage = {}
-    
-    if hasattr(request.user, 'employeeprofile'):
-        user_profile = request.user.employeeprofile
-        leave_balances = {
-            'ANNUAL': user_profile.annual_leaves,
-            'SICK': user_profile.sick_leaves,
-            'MATERNITY': user_profile.maternity_leaves,
-            'PATERNITY': user_profile.paternity_leaves,
-            'EMERGENCY': user_profile.emergency_leaves,
-            'COMPENSATORY': user_profile.compensatory_leaves,
-        }
+
+    if user_profile:
+        leave_balances = user_profile.leave_balances()
         
-        # Calculate current year usage
-        from datetime import datetime
+        # Calculate current year usage with one GROUP BY over approved
+        # leaves; duration_days is (to_date - from_date).days + 1, so each
+        # type's total is its summed date span plus one day per leave
         current_year = datetime.now().year
-        
+
+        usage_rows = Leave.objects.filter(
+            employee=request.user,
+            status='APPROVED',
+            from_date__year=current_year
+        ).values('leave_type').annotate(
+            span=Sum(ExpressionWrapper(
+                F('to_date') - F('from_date'),
+                output_field=DurationField()
+            )),
+            leaves=Count('id'),
+        )
+        used_by_type = {
+            row['leave_type']: row['span'].days + row['leaves']
+            for row in usage_rows
+        }
+
         for leave_type in leave_balances.keys():
-            used_days = Leave.objects.filter(
-                employee=request.user,
-                leave_type=leave_type,
-                status='APPROVED',
-                from_date__year=current_year
-            ).aggregate(
-                total=models.Sum('duration_days')
-            )['total'] or 0
-            
+            used_days = used_by_type.get(leave_type, 0)
             current_year_usage[leave_type] = {
                 'used': used_days,
                 'available': max(0, leave_balances[leave_type] - used_days),
@@ -988,15 +1242,46 @@ def manager_pending_leaves(request):
     pending_leaves = Leave.objects.filter(
         leave_query
     ).select_related(
-        'employee', 
+        'employee',
         'employee__employeeprofile'
+    ).only(
+        'id', 'leave_type', 'status', 'from_date', 'to_date',
+        'applied_on', 'reason',
+        'employee__first_name', 'employee__last_name',
+        'employee__username',
+        'employee__employeeprofile__designation',
     ).order_by('-applied_on')
     
     # Pagination
     paginator = Paginator(pending_leaves, 15)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
-    
+
+    # Pre-aggregate approved usage this year for the employees on this
+    # page in one GROUP BY, so the template can show how much of each
+    # type the requester has already taken without a query per row
+    current_year = date.today().year
+    employee_ids = {leave.employee_id for leave in page_obj}
+    usage_rows = Leave.objects.filter(
+        employee_id__in=employee_ids,
+        status='APPROVED',
+        from_date__year=current_year
+    ).values('employee_id', 'leave_type').annotate(
+        span=Sum(ExpressionWrapper(
+            F('to_date') - F('from_date'),
+            output_field=DurationField()
+        )),
+        leaves=Count('id'),
+    )
+    used_by_employee = {
+        (row['employee_id'], row['leave_type']): row['span'].days + row['leaves']
+        for row in usage_rows
+    }
+    for leave in page_obj:
+        leave.used_this_year = used_by_employee.get(
+            (leave.employee_id, leave.leave_type), 0
+        )
+
     # Get direct reports for filter (managers only)
     direct_reports = []
     if user.is_manager():
@@ -1062,30 +1347,73 @@ def hr_all_leaves(request):
         leave_query
     ).select_related(
         'employee',
-        'employee__employeeprofile', 
         'approver'
-    ).order_by('-applied_on')
-    
-    # Pagination
-    paginator = Paginator(all_leaves, 20)  # 20 requests per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
-    # Get unique departments for filter
-    departments = User.objects.values_list(
-        'department', flat=True
-    ).distinct().exclude(department='').order_by('department')
-    
-    # Get leave statistics
+    ).only(
+        'id', 'leave_type', 'status', 'from_date', 'to_date',
+        'applied_on', 'approved_on', 'reason', 'rejection_reason',
+        'employee__first_name', 'employee__last_name',
+        'employee__username', 'employee__department',
+        'employee__employee_id',
+        'approver__first_name', 'approver__last_name',
+        'approver__username',
+    ).order_by('-applied_on', '-id')
+
+    # Get leave statistics in one conditional aggregate (before the
+    # pagination cursor narrows the queryset)
+    status_counts = all_leaves.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='PENDING')),
+        approved=Count('id', filter=Q(status='APPROVED')),
+        rejected=Count('id', filter=Q(status='REJECTED')),
+    )
     leave_stats = {
-        'total': all_leaves.count(),
-        'pending': all_leaves.filter(status='PENDING').count(),
-        'approved': all_leaves.filter(status='APPROVED').count(),
-        'rejected': all_leaves.filter(status='REJECTED').count(),
+        'total': status_counts['total'],
+        'pending': status_counts['pending'],
+        'approved': status_counts['approved'],
+        'rejected': status_counts['rejected'],
     }
+
+    # Keyset pagination on (applied_on, id): OFFSET walks and discards
+    # every earlier row on deep pages, while the cursor filter jumps
+    # straight to the page via the (status, applied_on) index
+    page_size = 20
+    try:
+        # parse_datetime raises for well-formed but invalid datetimes
+        # (e.g. month 13); a bad cursor just means the first page
+        before_ts = parse_datetime(request.GET.get('before', ''))
+    except ValueError:
+        before_ts = None
+    try:
+        before_id = int(request.GET.get('before_id', ''))
+    except ValueError:
+        before_id = None
+
+    if before_ts is not None and before_id is not None:
+        all_leaves = all_leaves.filter(
+            Q(applied_on__lt=before_ts) |
+            Q(applied_on=before_ts, id__lt=before_id)
+        )
+
+    # Fetch one extra row to learn whether a next page exists
+    leaves_page = list(all_leaves[:page_size + 1])
+    has_next = len(leaves_page) > page_size
+    leaves_page = leaves_page[:page_size]
+
+    next_before = next_before_id = None
+    if has_next:
+        last = leaves_page[-1]
+        next_before = last.applied_on.isoformat()
+        next_before_id = last.id
+
+    # Get unique departments for filter
+    departments = _department_list()
     
     context = {
-        'all_leaves': page_obj,
+        'all_leaves': leaves_page,
+        'has_previous': before_ts is not None,
+        'has_next': has_next,
+        'next_before': next_before,
+        'next_before_id': next_before_id,
         'status_filter': status_filter,
         'employee_filter': employee_filter,
         'leave_type_filter': leave_type_filter,
@@ -1102,7 +1430,7 @@ def hr_all_leaves(request):
 
 
 @login_required
-@manager_or_above_required
+@manager_required
 def manage_team_leaves(request):
     """
     Legacy view - redirects to appropriate view based on user role.
@@ -1125,77 +1453,83 @@ def approve_leave(request, leave_id):
     """
     Approve a leave request with balance deduction.
     """
-    leave = get_object_or_404(Leave, id=leave_id)
-    
-    # Check if user can manage this leave
-    if not can_manage_leave(request.user, leave):
-        messages.error(request, 'You do not have permission to manage this leave request.')
-        return redirect('dashboard')
-    
-    if leave.status != 'PENDING':
-        messages.error(request, 'This leave request has already been processed.')
-    else:
-        # Check if employee has sufficient balance
-        try:
-            employee_profile = leave.employee.employeeprofile
-            duration = leave.duration_days
-            
-            # Get current balance
-            balance_field_map = {
-                'ANNUAL': 'annual_leaves',
-                'SICK': 'sick_leaves',
-                'MATERNITY': 'maternity_leaves',
-                'PATERNITY': 'paternity_leaves',
-                'EMERGENCY': 'emergency_leaves',
-                'COMPENSATORY': 'compensatory_leaves',
-            }
-            
-            if leave.leave_type in balance_field_map:
-                balance_field = balance_field_map[leave.leave_type]
-                current_balance = getattr(employee_profile, balance_field)
-                
-                if current_balance >= duration:
-                    # Deduct from balance
-                    setattr(employee_profile, balance_field, current_balance - duration)
-                    employee_profile.save()
-                    
-                    # Approve the leave
+    # Lock the leave and profile rows for the duration of the approval so
+    # two managers approving concurrently cannot both read the same
+    # balance and double-deduct (SQLite ignores FOR UPDATE but serializes
+    # writers on its own)
+    with transaction.atomic():
+        # Join the profile/manager chain that can_manage_leave and the
+        # message strings walk; of=('self',) keeps the row lock on the
+        # leave alone since the joined rows are nullable
+        leave = get_object_or_404(
+            Leave.objects.select_for_update(of=('self',)).select_related(
+                'employee__employeeprofile__manager'
+            ),
+            id=leave_id
+        )
+
+        # Check if user can manage this leave
+        if not can_manage_leave(request.user, leave):
+            messages.error(request, 'You do not have permission to manage this leave request.')
+            return redirect('dashboard')
+
+        if leave.status != 'PENDING':
+            messages.error(request, 'This leave request has already been processed.')
+        else:
+            # Check if employee has sufficient balance
+            try:
+                employee_profile = EmployeeProfile.objects.select_for_update().get(user=leave.employee)
+                duration = leave.duration_days
+
+                # Get current balance
+                balance_field_map = EmployeeProfile.LEAVE_BALANCE_FIELDS
+
+                if leave.leave_type in balance_field_map:
+                    balance_field = balance_field_map[leave.leave_type]
+                    current_balance = getattr(employee_profile, balance_field)
+
+                    if current_balance >= duration:
+                        # Deduct from balance
+                        setattr(employee_profile, balance_field, current_balance - duration)
+                        employee_profile.save(update_fields=[balance_field, 'updated_at'])
+
+                        # Approve the leave
+                        leave.status = 'APPROVED'
+                        leave.approver = request.user
+                        leave.approved_on = timezone.now()
+                        leave.save(update_fields=['status', 'approver', 'approved_on', 'updated_at'])
+
+                        messages.success(
+                            request,
+                            f'{leave.employee.get_full_name()}\'s {leave.get_leave_type_display().lower()} '
+                            f'from {leave.from_date} to {leave.to_date} has been approved. '
+                            f'{duration} days deducted from {leave.get_leave_type_display().lower()} balance.'
+                        )
+                    else:
+                        messages.error(
+                            request,
+                            f'Cannot approve leave. {leave.employee.get_full_name()} has insufficient '
+                            f'{leave.get_leave_type_display().lower()} balance. '
+                            f'Required: {duration} days, Available: {current_balance} days.'
+                        )
+                else:
+                    # For leave types without balance tracking (like UNPAID, OTHER)
                     leave.status = 'APPROVED'
                     leave.approver = request.user
                     leave.approved_on = timezone.now()
-                    leave.save()
-                    
+                    leave.save(update_fields=['status', 'approver', 'approved_on', 'updated_at'])
+
                     messages.success(
                         request,
                         f'{leave.employee.get_full_name()}\'s {leave.get_leave_type_display().lower()} '
-                        f'from {leave.from_date} to {leave.to_date} has been approved. '
-                        f'{duration} days deducted from {leave.get_leave_type_display().lower()} balance.'
-                    )
-                else:
-                    messages.error(
-                        request,
-                        f'Cannot approve leave. {leave.employee.get_full_name()} has insufficient '
-                        f'{leave.get_leave_type_display().lower()} balance. '
-                        f'Required: {duration} days, Available: {current_balance} days.'
+                        f'from {leave.from_date} to {leave.to_date} has been approved.'
                     )
-            else:
-                # For leave types without balance tracking (like UNPAID, OTHER)
-                leave.status = 'APPROVED'
-                leave.approver = request.user
-                leave.approved_on = timezone.now()
-                leave.save()
-                
-                messages.success(
+
+            except EmployeeProfile.DoesNotExist:
+                messages.error(
                     request,
-                    f'{leave.employee.get_full_name()}\'s {leave.get_leave_type_display().lower()} '
-                    f'from {leave.from_date} to {leave.to_date} has been approved.'
+                    f'Cannot approve leave. Employee profile not found for {leave.employee.get_full_name()}.'
                 )
-                
-        except EmployeeProfile.DoesNotExist:
-            messages.error(
-                request,
-                f'Cannot approve leave. Employee profile not found for {leave.employee.get_full_name()}.'
-            )
     
     # Redirect based on user role
     if request.user.is_hr() or request.user.is_admin_role():
@@ -1211,8 +1545,13 @@ def reject_leave(request, leave_id):
     """
     Reject a leave request with optional reason.
     """
-    leave = get_object_or_404(Leave, id=leave_id)
-    
+    # Join the profile/manager chain can_manage_leave walks so the
+    # permission check costs no extra queries
+    leave = get_object_or_404(
+        Leave.objects.select_related('employee__employeeprofile__manager'),
+        id=leave_id
+    )
+
     # Check if user can manage this leave
     if not can_manage_leave(request.user, leave):
         messages.error(request, 'You do not have permission to manage this leave request.')
@@ -1228,7 +1567,7 @@ def reject_leave(request, leave_id):
         leave.approver = request.user
         leave.approved_on = timezone.now()
         leave.rejection_reason = rejection_reason
-        leave.save()
+        leave.save(update_fields=['status', 'approver', 'approved_on', 'rejection_reason', 'updated_at'])
         
         reason_text = f' Reason: {rejection_reason}' if rejection_reason else ''
         
@@ -1274,18 +1613,30 @@ def project_list(request):
     if manager_filter:
         projects = projects.filter(manager_id=manager_filter)
     
-    # Order by most recent
-    projects = projects.select_related('manager').order_by('-created_at')
-    
-    # Pagination
-    paginator = Paginator(projects, 12)  # 12 projects per page
+    # Order by most recent; annotate member counts so the template does
+    # not run one COUNT per project card. The cards only show a clamped
+    # two-line blurb, so defer the full description text and select a
+    # short snippet instead; the icontains search above still matches
+    # against the whole column
+    projects = projects.select_related('manager').defer('description').annotate(
+        num_members=Count('projectmember'),
+        description_snippet=Substr('description', 1, 160),
+    ).order_by('-created_at')
+    
+    # Pagination; the COUNT is memoized per filter signature once the
+    # table is large enough for it to matter
+    paginator = CachedCountPaginator(
+        projects, 12,  # 12 projects per page
+        count_key=f'project_list:{search_query}:{status_filter}:{manager_filter}',
+    )
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    # Get managers for filter
+    # Get managers for filter; the dropdown renders id and name only, so
+    # skip hydrating the rest of the user row
     managers = User.objects.filter(
         role__in=['MANAGER', 'HR', 'ADMIN']
-    ).order_by('first_name', 'last_name')
+    ).only('id', 'first_name', 'last_name').order_by('first_name', 'last_name')
     
     context = {
         'projects': page_obj,
@@ -1294,7 +1645,7 @@ def project_list(request):
         'manager_filter': manager_filter,
         'managers': managers,
         'status_choices': Project.STATUS_CHOICES,
-        'total_projects': projects.count(),
+        'total_projects': paginator.count,
     }
     
     return render(request, 'core/project_list.html', context)
@@ -1361,29 +1712,38 @@ def project_detail(request, project_id):
     View for displaying project details and team members.
     Accessible by HR/Admin and project members.
     """
-    project = get_object_or_404(Project, id=project_id)
-    
+    # Join the manager so the manager check and template need no extra
+    # query
+    project = get_object_or_404(
+        Project.objects.select_related('manager'), id=project_id
+    )
+
+    # Get project members once; the membership check and the count below
+    # both come from this list instead of their own queries
+    members = list(ProjectMember.objects.filter(
+        project=project
+    ).select_related('employee', 'employee__employeeprofile').only(
+        'id', 'role', 'joined_on', 'employee_id',
+        'employee__first_name', 'employee__last_name',
+        'employee__employeeprofile__designation',
+    ).order_by('joined_on'))
+
     # Check permission
     user_can_manage = request.user.is_hr() or request.user.is_admin_role()
-    is_project_member = ProjectMember.objects.filter(
-        project=project, employee=request.user
-    ).exists()
-    is_project_manager = project.manager == request.user
-    
+    is_project_member = any(
+        member.employee_id == request.user.id for member in members
+    )
+    is_project_manager = project.manager_id == request.user.id
+
     if not (user_can_manage or is_project_member or is_project_manager):
         messages.error(request, 'You do not have permission to view this project.')
         return redirect('my_projects')
-    
-    # Get project members
-    members = ProjectMember.objects.filter(
-        project=project
-    ).select_related('employee', 'employee__employeeprofile').order_by('joined_on')
-    
+
     # Forms for adding members (only for HR/Admin)
     add_member_form = None
     if user_can_manage:
         add_member_form = ProjectMemberForm(project=project)
-    
+
     context = {
         'project': project,
         'members': members,
@@ -1391,7 +1751,7 @@ def project_detail(request, project_id):
         'user_can_manage': user_can_manage,
         'is_project_member': is_project_member,
         'is_project_manager': is_project_manager,
-        'member_count': members.count(),
+        'member_count': len(members),
     }
     
     return render(request, 'core/project_detail.html', context)
@@ -1403,20 +1763,25 @@ def project_delete(request, project_id):
     """
     View for HR/Admin to delete projects.
     """
-    project = get_object_or_404(Project, id=project_id)
-    
+    # Annotate the member count onto the fetch itself; the confirmation
+    # page needs no second COUNT query
+    project = get_object_or_404(
+        Project.objects.annotate(num_members=Count('projectmember')),
+        id=project_id
+    )
+
     if request.method == 'POST':
         project_name = project.name
         project.delete()
         messages.success(
-            request, 
+            request,
             f'Project "{project_name}" has been deleted successfully.'
         )
         return redirect('project_list')
-    
+
     context = {
         'project': project,
-        'member_count': project.projectmember_set.count(),
+        'member_count': project.num_members,
     }
     
     return render(request, 'core/project_delete_confirm.html', context)
@@ -1443,12 +1808,15 @@ def project_add_member(request, project_id):
             f'as {member.role or "team member"}.'
         )
     else:
-        for error in form.non_field_errors():
-            messages.error(request, error)
-        for field, errors in form.errors.items():
-            for error in errors:
-                messages.error(request, f'{field}: {error}')
-    
+        # One flash message (and one session write) covers every form
+        # error instead of a message per error
+        error_lines = list(form.non_field_errors()) + [
+            f'{field}: {error}'
+            for field, errors in form.errors.items() if field != '__all__'
+            for error in errors
+        ]
+        messages.error(request, '\n'.join(error_lines))
+
     return redirect('project_detail', project_id=project.id)
 
 
@@ -1458,9 +1826,14 @@ def project_edit_member(request, project_id, member_id):
     """
     View for HR/Admin to edit project member roles.
     """
-    project = get_object_or_404(Project, id=project_id)
-    member = get_object_or_404(ProjectMember, id=member_id, project=project)
-    
+    # One fetch covers the member, its project and the employee shown in
+    # the flash message
+    member = get_object_or_404(
+        ProjectMember.objects.select_related('project', 'employee'),
+        id=member_id, project_id=project_id
+    )
+    project = member.project
+
     if request.method == 'POST':
         form = ProjectMemberEditForm(request.POST, instance=member)
         if form.is_valid():
@@ -1490,9 +1863,14 @@ def project_remove_member(request, project_id, member_id):
     """
     View for HR/Admin to remove members from projects.
     """
-    project = get_object_or_404(Project, id=project_id)
-    member = get_object_or_404(ProjectMember, id=member_id, project=project)
-    
+    # One fetch covers the member, its project and the employee shown in
+    # the flash message
+    member = get_object_or_404(
+        ProjectMember.objects.select_related('project', 'employee'),
+        id=member_id, project_id=project_id
+    )
+    project = member.project
+
     employee_name = member.employee.get_full_name()
     member.delete()
     
@@ -1509,48 +1887,54 @@ def my_projects(request):
     """
     View for employees to see their current projects and team members.
     """
-    # Get projects where user is a member
-    member_projects = Project.objects.filter(
-        projectmember__employee=request.user
-    ).select_related('manager').order_by('name')
-    
+    # Every card renders its full team, so attach the members to each
+    # project up front - one prefetch query per queryset instead of one
+    # team query per project
+    team_queryset = ProjectMember.objects.select_related(
+        'employee'
+    ).only(
+        'id', 'role', 'project_id',
+        'employee__first_name', 'employee__last_name',
+    ).order_by('employee__first_name')
+
+    # Get project memberships with details and each project's team
+    memberships = ProjectMember.objects.filter(
+        employee=request.user
+    ).select_related('project', 'project__manager').prefetch_related(
+        Prefetch('project__projectmember_set', queryset=team_queryset,
+                 to_attr='team_members')
+    ).order_by('project__name')
+
     # Get projects where user is the manager
     managed_projects = Project.objects.filter(
         manager=request.user
-    ).select_related('manager').order_by('name')
-    
-    # Get project memberships with details
-    memberships = ProjectMember.objects.filter(
-        employee=request.user
-    ).select_related('project', 'project__manager').order_by('project__name')
-    
+    ).select_related('manager').prefetch_related(
+        Prefetch('projectmember_set', queryset=team_queryset,
+                 to_attr='team_members')
+    ).order_by('name')
+
     # Create a list of projects with membership details
     project_details = []
-    
+
     # Add projects where user is a member
     for membership in memberships:
-        team_members = ProjectMember.objects.filter(
-            project=membership.project
-        ).select_related('employee', 'employee__employeeprofile').order_by('employee__first_name')
-        
         project_details.append({
             'project': membership.project,
             'my_role': membership.role,
-            'team_members': team_members,
+            'team_members': membership.project.team_members,
             'is_manager': False,
         })
-    
-    # Add projects where user is manager but not a member
+
+    # Add projects where user is manager but not a member; the
+    # memberships above already name every project the user belongs to,
+    # so test against that set instead of one EXISTS query per project
+    member_project_ids = {membership.project_id for membership in memberships}
     for project in managed_projects:
-        if not project.projectmember_set.filter(employee=request.user).exists():
-            team_members = ProjectMember.objects.filter(
-                project=project
-            ).select_related('employee', 'employee__employeeprofile').order_by('employee__first_name')
-            
+        if project.id not in member_project_ids:
             project_details.append({
                 'project': project,
                 'my_role': 'Project Manager',
-                'team_members': team_members,
+                'team_members': project.team_members,
                 'is_manager': True,
             })
     
@@ -1587,17 +1971,24 @@ def timesheet_entry(request):
     else:
         form = TimesheetEntryForm(user=request.user)
     
-    # Get recent entries for context
-    recent_entries = TimesheetEntry.objects.filter(
+    # Get recent entries for context; today's entries lead the list
+    # because of the date ordering, so today's total comes from the rows
+    # already in hand instead of a second aggregate query
+    recent_entries = list(TimesheetEntry.objects.filter(
         employee=request.user
-    ).select_related('project').order_by('-date', '-created_at')[:5]
-    
-    # Get today's total hours
-    from django.db.models import Sum
-    today_total = TimesheetEntry.objects.filter(
-        employee=request.user,
-        date=date.today()
-    ).aggregate(total=Sum('hours'))['total'] or 0
+    ).select_related('project').order_by('-date', '-created_at')[:5])
+
+    today = date.today()
+    today_total = sum(
+        entry.hours for entry in recent_entries if entry.date == today
+    )
+    if len(recent_entries) == 5 and recent_entries[-1].date == today:
+        # All five slots are today's entries; there may be more today
+        # than the recent list holds, so fall back to the aggregate
+        today_total = TimesheetEntry.objects.filter(
+            employee=request.user,
+            date=today
+        ).aggregate(total=Sum('hours'))['total'] or 0
     
     context = {
         'form': form,
@@ -1664,65 +2055,66 @@ def timesheet_weekly_summary(request):
     """
     View for employees to see weekly summary of timesheet entries.
     """
-    from datetime import datetime, timedelta
-    
     # Get week parameters from query string or default to current week
-    week_str = request.GET.get('week', '')
+    # (the template's navigation links pass week_start)
+    today = date.today()
+    week_str = request.GET.get('week_start') or request.GET.get('week', '')
     if week_str:
         try:
             selected_date = datetime.strptime(week_str, '%Y-%m-%d').date()
         except ValueError:
-            selected_date = date.today()
+            selected_date = today
     else:
-        selected_date = date.today()
-    
+        selected_date = today
+
     # Calculate start and end of week (Monday to Sunday)
     days_since_monday = selected_date.weekday()
     start_date = selected_date - timedelta(days=days_since_monday)
     end_date = start_date + timedelta(days=6)
-    
-    # Get weekly summary
-    summary = TimesheetEntry.get_weekly_summary(
-        request.user, start_date, end_date
-    )
-    
-    # Generate daily breakdown
-    daily_breakdown = []
+
+    # Fetch the whole week once and bucket in Python - one round-trip
+    # instead of a per-day query plus a separate summary aggregate
+    entries = list(TimesheetEntry.objects.filter(
+        employee=request.user,
+        date__range=(start_date, end_date)
+    ).select_related('project').order_by('date', 'created_at'))
+
+    hours_by_day = defaultdict(float)
+    entries_by_day = defaultdict(int)
+    for entry in entries:
+        hours_by_day[entry.date] += float(entry.hours)
+        entries_by_day[entry.date] += 1
+
+    daily_summary = []
     for i in range(7):
         current_day = start_date + timedelta(days=i)
-        day_entries = TimesheetEntry.objects.filter(
-            employee=request.user,
-            date=current_day
-        ).select_related('project').order_by('created_at')
-        
-        day_total = sum(entry.hours for entry in day_entries)
-        
-        daily_breakdown.append({
+        daily_summary.append({
             'date': current_day,
-            'day_name': current_day.strftime('%A'),
-            'entries': day_entries,
-            'total_hours': day_total,
-            'is_today': current_day == date.today(),
+            'hours': hours_by_day[current_day],
+            'entries': entries_by_day[current_day],
+            'is_today': current_day == today,
         })
-    
+
     # Calculate navigation dates
     prev_week = start_date - timedelta(days=7)
     next_week = start_date + timedelta(days=7)
-    
-    # Check if next week is in the future
-    can_go_next = next_week <= date.today()
-    
+
+    total_hours = sum(hours_by_day.values())
+    days_with_entries = sum(1 for hours in hours_by_day.values() if hours)
+
     context = {
-        'summary': summary,
-        'daily_breakdown': daily_breakdown,
-        'start_date': start_date,
-        'end_date': end_date,
+        'entries': entries,
+        'daily_summary': daily_summary,
+        'total_hours': total_hours,
+        'days_with_entries': days_with_entries,
+        'avg_daily_hours': total_hours / days_with_entries if days_with_entries else 0,
+        'week_start': start_date,
+        'week_end': end_date,
         'prev_week': prev_week,
         'next_week': next_week,
-        'can_go_next': can_go_next,
-        'selected_week': start_date.strftime('%Y-%m-%d'),
+        'can_go_next': next_week <= today,
     }
-    
+
     return render(request, 'core/timesheet_weekly_summary.html', context)
 
 
@@ -1743,15 +2135,16 @@ def timesheet_daily_entries(request, entry_date):
     ).select_related('project').order_by('created_at')
     
     # Calculate total hours for the day
-    from django.db.models import Sum
     total_hours = entries.aggregate(total=Sum('hours'))['total'] or 0
     
     context = {
         'entries': entries,
         'target_date': target_date,
         'total_hours': total_hours,
+        'prev_date': target_date - timedelta(days=1),
+        'next_date': target_date + timedelta(days=1),
     }
-    
+
     return render(request, 'core/timesheet_daily_entries.html', context)
 
 
@@ -1761,7 +2154,16 @@ def timesheet_daily_entries(request, entry_date):
 @hr_required
 def payslip_list(request):
     """HR view to list all payslips with filtering options."""
-    payslips = Payslip.objects.select_related('employee').order_by('-year', '-month', 'employee__first_name')
+    # One joined query projecting exactly what the table renders: the
+    # pay components behind gross_pay/total_deductions plus the
+    # employee's name columns. Large text fields (notes) and the rest of
+    # the user row stay in the database.
+    payslips = Payslip.objects.select_related('employee').only(
+        'id', 'month', 'year', 'status', 'net_pay',
+        'basic', 'hra', 'allowances', 'overtime_pay', 'bonus',
+        'deductions', 'income_tax', 'provident_fund', 'professional_tax',
+        'employee__first_name', 'employee__last_name', 'employee__username',
+    ).order_by('-year', '-month', 'employee__first_name')
     
     # Filter by employee
     employee_id = request.GET.get('employee')
@@ -1781,17 +2183,27 @@ def payslip_list(request):
     if status:
         payslips = payslips.filter(status=status)
     
-    # Pagination
-    paginator = Paginator(payslips, 20)
+    # Pagination; with no filters active the total comes from planner
+    # statistics on PostgreSQL, otherwise the exact COUNT is memoized
+    # per filter signature once the table is large enough to matter
+    paginator = CachedCountPaginator(
+        payslips, 20,
+        count_key=f'payslip_list:{employee_id}:{month}:{year}:{status}',
+        estimate_model=Payslip if not any([employee_id, month, year, status]) else None,
+    )
     page_number = request.GET.get('page')
     payslips = paginator.get_page(page_number)
     
-    # Get filter options
-    employees = User.objects.filter(is_active=True).order_by('first_name', 'last_name')
+    # Get filter options; the dropdown renders id and name only, so skip
+    # hydrating the rest of the user row
+    employees = User.objects.filter(is_active=True).only(
+        'id', 'first_name', 'last_name'
+    ).order_by('first_name', 'last_name')
     
     context = {
         'payslips': payslips,
         'employees': employees,
+        'year_options': [str(y) for y in range(2023, date.today().year + 1)],
         'current_filters': {
             'employee': employee_id,
             'month': month,
@@ -1888,10 +2300,23 @@ def payslip_delete(request, payslip_id):
 @login_required
 def my_payslips(request):
     """Employee view to see their own payslips."""
-    payslips = Payslip.objects.filter(employee=request.user).order_by('-year', '-month')
-    
-    # Pagination
-    paginator = Paginator(payslips, 12)  # 12 payslips per page (1 year)
+    # The cards only show the monthly summary, so fetch a compact
+    # projection and compute the gross/deduction totals in SQL rather
+    # than hydrating all nine pay-component columns per row; the
+    # (employee, -year, -month) index drives the scan
+    payslips = Payslip.objects.filter(employee=request.user).only(
+        'id', 'month', 'year', 'status', 'net_pay', 'pay_date', 'generated_at',
+    ).annotate(
+        gross_total=F('basic') + F('hra') + F('allowances') + F('overtime_pay') + F('bonus'),
+        deduction_total=F('deductions') + F('income_tax') + F('provident_fund') + F('professional_tax'),
+    ).order_by('-year', '-month')
+
+    # Pagination; the COUNT is memoized once an employee has enough
+    # history for it to matter
+    paginator = CachedCountPaginator(
+        payslips, 12,  # 12 payslips per page (1 year)
+        count_key=f'my_payslips:{request.user.pk}',
+    )
     page_number = request.GET.get('page')
     payslips = paginator.get_page(page_number)
     
@@ -1902,6 +2327,15 @@ def my_payslips(request):
     return render(request, 'core/my_payslips.html', context)
 
 
+# Numeric CSV columns accepted by payslip_bulk_upload; they all go
+# through the same float() conversion with a 0 default.
+PAYSLIP_CSV_NUMERIC_FIELDS = (
+    'basic', 'hra', 'allowances', 'overtime_hours', 'overtime_pay',
+    'bonus', 'deductions', 'income_tax', 'provident_fund',
+    'professional_tax',
+)
+
+
 @login_required
 @hr_required
 def payslip_bulk_upload(request):
@@ -1912,79 +2346,109 @@ def payslip_bulk_upload(request):
             csv_file = form.cleaned_data['csv_file']
             
             try:
-                import csv
-                import io
-                from django.db import transaction
-                
-                # Read CSV file
-                file_data = csv_file.read().decode('utf-8')
-                reader = csv.DictReader(io.StringIO(file_data))
-                
-                created_count = 0
+                # TextIOWrapper decodes the upload lazily as the reader
+                # consumes it, instead of materializing bytes plus a
+                # decoded copy in memory first
+                reader = csv.DictReader(
+                    io.TextIOWrapper(csv_file.file, encoding='utf-8', newline='')
+                )
+                rows = list(reader)
+
+                # Resolve every employee identifier in two queries up
+                # front rather than one SELECT per row; repeated
+                # identifiers (re-runs, multi-month files) then cost
+                # nothing extra
+                identifiers = {
+                    row.get('employee_username') or row.get('employee_email')
+                    for row in rows
+                }
+                identifiers.discard(None)
+                identifiers.discard('')
+                # email is not unique on User, so build the map by hand
+                # rather than via in_bulk
+                employees_by_email = {
+                    user.email: user
+                    for user in User.objects.filter(
+                        email__in={i for i in identifiers if '@' in i}, is_active=True,
+                    )
+                }
+                employees_by_username = User.objects.filter(
+                    username__in={i for i in identifiers if '@' not in i}, is_active=True,
+                ).in_bulk(field_name='username')
+
                 errors = []
-                
+                parsed_rows = []
+
                 with transaction.atomic():
-                    for row_num, row in enumerate(reader, start=1):
+                    for row_num, row in enumerate(rows, start=1):
                         try:
                             # Get employee by username or email
                             employee_identifier = row.get('employee_username') or row.get('employee_email')
                             if not employee_identifier:
                                 errors.append(f"Row {row_num}: Missing employee identifier")
                                 continue
-                            
-                            try:
-                                if '@' in employee_identifier:
-                                    employee = User.objects.get(email=employee_identifier, is_active=True)
-                                else:
-                                    employee = User.objects.get(username=employee_identifier, is_active=True)
-                            except User.DoesNotExist:
+
+                            if '@' in employee_identifier:
+                                employee = employees_by_email.get(employee_identifier)
+                            else:
+                                employee = employees_by_username.get(employee_identifier)
+                            if employee is None:
                                 errors.append(f"Row {row_num}: Employee not found: {employee_identifier}")
                                 continue
-                            
-                            # Create payslip
+
+                            # Create payslip; the numeric columns share
+                            # one conversion loop over a precomputed
+                            # field tuple instead of ten hand-written
+                            # float() lines
                             payslip_data = {
-                                'employee': employee,
-                                'month': int(row.get('month', 0)),
-                                'year': int(row.get('year', 0)),
-                                'basic': float(row.get('basic', 0)),
-                                'hra': float(row.get('hra', 0)),
-                                'allowances': float(row.get('allowances', 0)),
-                                'overtime_hours': float(row.get('overtime_hours', 0)),
-                                'overtime_pay': float(row.get('overtime_pay', 0)),
-                                'bonus': float(row.get('bonus', 0)),
-                                'deductions': float(row.get('deductions', 0)),
-                                'income_tax': float(row.get('income_tax', 0)),
-                                'provident_fund': float(row.get('provident_fund', 0)),
-                                'professional_tax': float(row.get('professional_tax', 0)),
-                                'status': row.get('status', 'DRAFT'),
-                                'notes': row.get('notes', ''),
+                                field: float(row.get(field) or 0)
+                                for field in PAYSLIP_CSV_NUMERIC_FIELDS
                             }
-                            
+                            payslip_data.update(
+                                employee=employee,
+                                month=int(row.get('month') or 0),
+                                year=int(row.get('year') or 0),
+                                status=row.get('status') or 'DRAFT',
+                                notes=row.get('notes', ''),
+                            )
+
                             # Handle pay_date
                             pay_date_str = row.get('pay_date')
                             if pay_date_str:
-                                from datetime import datetime
                                 payslip_data['pay_date'] = datetime.strptime(pay_date_str, '%Y-%m-%d').date()
                             
-                            # Check for existing payslip
-                            existing = Payslip.objects.filter(
-                                employee=employee,
-                                month=payslip_data['month'],
-                                year=payslip_data['year']
-                            ).first()
-                            
-                            if existing:
-                                errors.append(f"Row {row_num}: Payslip already exists for {employee.get_full_name()}")
-                                continue
-                            
-                            # Create payslip
-                            Payslip.objects.create(**payslip_data)
-                            created_count += 1
-                            
+                            # Queue the payslip; bulk_create below skips
+                            # save(), which normally fills net_pay, so
+                            # compute it here
+                            payslip = Payslip(**payslip_data)
+                            payslip.net_pay = payslip.gross_pay - payslip.total_deductions
+                            parsed_rows.append((row_num, payslip))
+
                         except (ValueError, KeyError) as e:
                             errors.append(f"Row {row_num}: Invalid data - {str(e)}")
                             continue
-                
+
+                    # Probe for existing payslips in one query instead of
+                    # one SELECT per CSV row; the set also catches
+                    # duplicate rows within the same upload
+                    existing_keys = set(Payslip.objects.filter(
+                        employee_id__in={p.employee_id for _, p in parsed_rows}
+                    ).values_list('employee_id', 'month', 'year'))
+
+                    pending_payslips = []
+                    for row_num, payslip in parsed_rows:
+                        key = (payslip.employee_id, payslip.month, payslip.year)
+                        if key in existing_keys:
+                            errors.append(f"Row {row_num}: Payslip already exists for {payslip.employee.get_full_name()}")
+                            continue
+                        existing_keys.add(key)
+                        pending_payslips.append(payslip)
+
+                    # One INSERT per batch instead of one per CSV row
+                    Payslip.objects.bulk_create(pending_payslips, batch_size=500)
+
+                created_count = len(pending_payslips)
+
                 if created_count > 0:
                     messages.success(request, f'Successfully created {created_count} payslips.')
                 
@@ -55,6 +55,11 @@ MIDDLEWARE = [
     'core.middleware.RoleBasedAccessMiddleware',
 ]
 
+if DEBUG:
+    # Logs requests with excessive or repeated queries; see
+    # core.middleware.QueryCountLogMiddleware
+    MIDDLEWARE.append('core.middleware.QueryCountLogMiddleware')
+
 ROOT_URLCONF = 'hrms_core.urls'
 
 TEMPLATES = [
@@ -86,10 +91,29 @@ DATABASES = {
         'PASSWORD': config('DATABASE_PASSWORD', default=''),
         'HOST': config('DATABASE_HOST', default=''),
         'PORT': config('DATABASE_PORT', default=''),
+        # Reuse database connections across requests instead of opening a
+        # new one per request (0 restores Django's default behaviour)
+        'CONN_MAX_AGE': config('DATABASE_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Cache
+# Local-memory cache by default; point CACHE_BACKEND/CACHE_LOCATION at
+# Redis (django.core.cache.backends.redis.RedisCache) in production.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='hrms-cache'),
+    }
+}
+
+# Write sessions to the database but serve reads from the cache, so the
+# per-request session lookup behind request.user skips the database.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 